@@ -15,25 +15,111 @@ Usage:
     python module-generator.py --stack go --domain wallet --name transaction --fields "amount:float64,status:string,user_id:string" --project github.com/user/app
     python module-generator.py --stack laravel --domain Wallet --name Transaction --fields "amount:decimal,status:string,user_id:string"
 
+    # Print the files to stdout instead of writing them
+    python module-generator.py --stack react --name Product --fields "name:string,price:number" --stdout
+
+    # Go: only scaffold the listed CRUD operations
+    python module-generator.py --stack go --domain wallet --name transaction --fields "amount:float64" --project github.com/user/app --ops create,list
+
     # Frontend (simple feature-based)
     python module-generator.py --stack react --name Product --fields "name:string,price:number"
     python module-generator.py --stack flutter --name product --fields "name:String,price:int"
 """
 
-import argparse
 import os
-import sys
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Dict, Any
+from functools import lru_cache
+from typing import List, Tuple, Dict, NamedTuple
+
+# =============================================================================
+# NAMING HELPERS
+# =============================================================================
+# Pure functions of short identifiers that are converted over and over across
+# templates, so each unique name is transformed only once.
+
+@lru_cache(maxsize=1024)
+def to_pascal_case(name: str) -> str:
+    return ''.join([word.capitalize() for word in name.replace('-', '_').split('_')])
+
+
+@lru_cache(maxsize=1024)
+def to_camel_case(name: str) -> str:
+    words = name.replace('-', '_').split('_')
+    return words[0].lower() + ''.join([word.capitalize() for word in words[1:]])
+
+
+@lru_cache(maxsize=1024)
+def to_snake_case(name: str) -> str:
+    return name.lower().replace('-', '_')
+
+
+@lru_cache(maxsize=1024)
+def to_kebab_case(name: str) -> str:
+    return name.lower().replace('_', '-')
+
+
+@lru_cache(maxsize=1024)
+def pluralize(name: str) -> str:
+    if name.endswith('y'):
+        return name[:-1] + 'ies'
+    elif name.endswith(('s', 'x', 'ch', 'sh')):
+        return name + 'es'
+    return name + 's'
+
+
+# =============================================================================
+# FIELD PARSING
+# =============================================================================
+
+def _parse_fields(fields_str: str, default_type: str) -> List[Tuple[str, str, bool]]:
+    """Parse "name:type,name:type?" into (name, type, required) tuples"""
+    fields = []
+    append = fields.append
+    for field in fields_str.split(','):
+        field = field.strip()
+        if not field:
+            continue
+        # A trailing '?' marks the field optional
+        stripped = field.rstrip('?')
+        name, sep, field_type = stripped.partition(':')
+        append((name.strip(), field_type.strip() if sep else default_type, len(stripped) == len(field)))
+    return fields
+
 
 # =============================================================================
 # BASE GENERATOR
 # =============================================================================
 
+CRUD_OPS = ('create', 'read', 'list', 'update', 'delete')
+
+# Rendered files of recent generator runs in this process, oldest first
+_RENDER_CACHE: Dict[tuple, Tuple[Tuple[Path, str], ...]] = {}
+_RENDER_CACHE_SIZE = 128
+
+
+class Field(NamedTuple):
+    """Parsed field with the derived names the templates need"""
+    name: str
+    type: str
+    required: bool
+    pascal: str
+    camel: str
+    storage_type: str  # nullable storage type, pointer when optional (Go)
+
+
 class BaseGenerator(ABC):
     """Base class for all stack generators"""
 
+    __slots__ = (
+        'module_name', 'entity_name', 'project', 'output_dir', 'domain_name',
+        'domain_pascal', 'options', 'ops', 'fields', 'camel_name', 'plural_name', 'route',
+        '_mkdir_cache',
+    )
+
+    # Field type used when a field is given without ":type"
+    DEFAULT_TYPE = 'string'
+
     def __init__(self, name: str, fields: str, project: str, output_dir: str, domain: str = '', **options):
         self.module_name = name.lower()
         self.entity_name = self.to_pascal_case(name)
@@ -42,136 +128,211 @@ class BaseGenerator(ABC):
         self.domain_name = domain.lower() if domain else self.module_name
         self.domain_pascal = self.to_pascal_case(domain) if domain else self.entity_name
         self.options = options
-        self.fields = self.parse_fields(fields)
+        ops = frozenset(options.get('ops') or CRUD_OPS)
+        unknown = ops.difference(CRUD_OPS)
+        if unknown:
+            raise ValueError(f"Unknown CRUD operation(s): {', '.join(sorted(unknown))} (valid: {', '.join(CRUD_OPS)})")
+        self.ops = ops
+        self._mkdir_cache: set = set()
+        self.fields = [
+            Field(n, t, r, to_pascal_case(n), to_camel_case(n), t if r or t.startswith('*') else '*' + t)
+            for n, t, r in self.parse_fields(fields)
+        ]
+        # Derived names shared by several templates, computed once per module
+        self.camel_name = self.to_camel_case(self.module_name)
+        self.plural_name = self.pluralize(self.module_name)
+        self.route = self.to_kebab_case(self.plural_name)
+
+    # Naming helpers, kept on the class for backwards compatibility
+    to_pascal_case = staticmethod(to_pascal_case)
+    to_camel_case = staticmethod(to_camel_case)
+    to_snake_case = staticmethod(to_snake_case)
+    to_kebab_case = staticmethod(to_kebab_case)
+    pluralize = staticmethod(pluralize)
 
-    @staticmethod
-    def to_pascal_case(name: str) -> str:
-        return ''.join(word.capitalize() for word in name.replace('-', '_').split('_'))
-
-    @staticmethod
-    def to_camel_case(name: str) -> str:
-        words = name.replace('-', '_').split('_')
-        return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
-
-    @staticmethod
-    def to_snake_case(name: str) -> str:
-        return name.lower().replace('-', '_')
-
-    @staticmethod
-    def to_kebab_case(name: str) -> str:
-        return name.lower().replace('_', '-')
-
-    @staticmethod
-    def pluralize(name: str) -> str:
-        if name.endswith('y'):
-            return name[:-1] + 'ies'
-        elif name.endswith(('s', 'x', 'ch', 'sh')):
-            return name + 'es'
-        return name + 's'
+    def parse_fields(self, fields_str: str) -> List[Tuple[str, str, bool]]:
+        return _parse_fields(fields_str, self.DEFAULT_TYPE)
 
     @abstractmethod
-    def parse_fields(self, fields_str: str) -> List[Tuple[str, str, bool]]:
+    def render_files(self) -> List[Tuple[Path, str]]:
+        """Render every file of the module as (path, content) pairs, without touching disk"""
         pass
 
-    @abstractmethod
     def generate(self) -> List[str]:
-        pass
+        artifact = self.options.get('artifact')
+        if artifact:
+            return self._write_archive(self._render_cached(), artifact)
+        if self.options.get('stdout'):
+            return self._write_stream(self._render_cached())
+        return self._write_all(self._render_cached())
+
+    def _render_cached(self) -> Tuple[Tuple[Path, str], ...]:
+        key = (
+            type(self), self.module_name, self.entity_name, self.domain_name, self.domain_pascal,
+            self.project, self.output_dir, tuple(self.fields), self.ops,
+        )
+        pairs = _RENDER_CACHE.get(key)
+        if pairs is None:
+            if len(_RENDER_CACHE) >= _RENDER_CACHE_SIZE:
+                del _RENDER_CACHE[next(iter(_RENDER_CACHE))]
+            pairs = _RENDER_CACHE[key] = tuple(self.render_files())
+        return pairs
 
     def write_file(self, path: Path, content: str) -> str:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
+        self._ensure_dir(path.parent)
+        return self._write_content(path, content)
+
+    def _ensure_dir(self, directory: Path) -> None:
+        if directory not in self._mkdir_cache:
+            os.makedirs(directory, exist_ok=True)
+            self._mkdir_cache.add(directory)
+
+    def _write_content(self, path: Path, content: str) -> str:
+        """Write one file into an existing directory"""
+        data = content.encode('utf-8')
+        # Leave identical files untouched so re-runs don't wake file watchers
+        try:
+            if path.stat().st_size == len(data) and path.read_bytes() == data:
+                return str(path)
+        except FileNotFoundError:
+            pass
+        # Content is fully rendered already, so skip Python's buffer and hand
+        # the whole file to the OS at once
+        with open(path, 'wb', buffering=0) as fh:
+            view = memoryview(data)
+            while view:
+                view = view[fh.write(view):]
         return str(path)
 
+    def _write_archive(self, pairs: List[Tuple[Path, str]], artifact: str) -> List[str]:
+        """Stream rendered files into one uncompressed tar instead of the filesystem"""
+        import io
+        import tarfile
+        import time
+
+        names = []
+        mtime = time.time()
+        with tarfile.open(artifact, 'w|') as tar:
+            for path, content in pairs:
+                data = content.encode('utf-8')
+                info = tarfile.TarInfo(path.relative_to(self.output_dir).as_posix())
+                info.size = len(data)
+                info.mtime = mtime
+                tar.addfile(info, io.BytesIO(data))
+                names.append(info.name)
+        return names
+
+    def _write_stream(self, pairs: List[Tuple[Path, str]]) -> List[str]:
+        """Write rendered files to stdout, each preceded by a "--- FILE: path ---" line"""
+        import sys
+
+        names = [str(path) for path, _ in pairs]
+        out = ''.join([f'--- FILE: {name} ---\n{content}\n' for name, (_, content) in zip(names, pairs)])
+        # One write for the whole module; any text stream works, so callers
+        # may redirect stdout
+        sys.stdout.write(out)
+        sys.stdout.flush()
+        return names
+
+    def _write_all(self, pairs: List[Tuple[Path, str]]) -> List[str]:
+        """Write rendered (path, content) pairs in order"""
+        # Create directories up front, so the writes never mkdir
+        parents = {path.parent for path, _ in pairs} - self._mkdir_cache
+        for parent in parents:
+            os.makedirs(parent, exist_ok=True)
+        self._mkdir_cache |= parents
+        # Sequential on purpose: files of a few KB land in the page cache, so a
+        # thread pool costs more in startup and handoff than the writes overlap
+        return [self._write_content(path, content) for path, content in pairs]
 
 # =============================================================================
 # GO DDD GENERATOR
 # =============================================================================
 
+_GORM_TYPE_MAP = {
+    'string': 'varchar(255)', '*string': 'varchar(255)',
+    'int': 'int', 'int32': 'int', 'int64': 'bigint',
+    '*int': 'int', '*int64': 'bigint',
+    'float32': 'float', 'float64': 'double',
+    'bool': 'boolean', '*bool': 'boolean',
+    'time.Time': 'datetime',
+}
+_GORM_GET = _GORM_TYPE_MAP.get
+
+# Route registrations do not depend on the entity, so they are rendered once
+# here and the handler only picks the ones for the requested operations
+_GO_ROUTES = (
+    ('create', '\t\tgroup.POST("", h.Create)'),
+    ('list', '\t\tgroup.GET("", h.List)'),
+    ('read', '\t\tgroup.GET("/:id", h.GetByID)'),
+    ('update', '\t\tgroup.PUT("/:id", h.Update)'),
+    ('delete', '\t\tgroup.DELETE("/:id", h.Delete)'),
+)
+
+
 class GoGenerator(BaseGenerator):
     """Go + Gin + GORM DDD generator"""
 
-    def parse_fields(self, fields_str: str) -> List[Tuple[str, str, bool]]:
-        fields = []
-        for field in fields_str.split(','):
-            field = field.strip()
-            if not field:
-                continue
-            required = not field.endswith('?')
-            field = field.rstrip('?')
-            if ':' in field:
-                name, go_type = field.split(':', 1)
-            else:
-                name, go_type = field, 'string'
-            fields.append((name.strip(), go_type.strip(), required))
-        return fields
-
-    def _gorm_type(self, go_type: str) -> str:
-        type_map = {
-            'string': 'varchar(255)', '*string': 'varchar(255)',
-            'int': 'int', 'int32': 'int', 'int64': 'bigint',
-            '*int': 'int', '*int64': 'bigint',
-            'float32': 'float', 'float64': 'double',
-            'bool': 'boolean', '*bool': 'boolean',
-            'time.Time': 'datetime',
-        }
-        return type_map.get(go_type, 'varchar(255)')
+    __slots__ = ()
 
-    def generate(self) -> List[str]:
-        files = []
+    def render_files(self) -> List[Tuple[Path, str]]:
+        pairs = []
         base = self.output_dir / 'internal'
         domain_dir = base / 'domain' / self.domain_name
 
         # --- Domain Layer ---
 
         # Entity
-        files.append(self.write_file(
+        pairs.append((
             domain_dir / 'entities' / f'{self.module_name}.go',
             self._entity_template()
         ))
 
         # Value Objects (status)
-        if any(n == 'status' or n.endswith('_status') for n, _, _ in self.fields):
-            files.append(self.write_file(
+        if any(f.name == 'status' or f.name.endswith('_status') for f in self.fields):
+            pairs.append((
                 domain_dir / 'valueobjects' / f'{self.module_name}_status.go',
                 self._value_object_template()
             ))
 
         # Port (store interface)
-        files.append(self.write_file(
+        pairs.append((
             domain_dir / 'ports' / f'{self.module_name}_store.go',
             self._port_template()
         ))
 
         # Event
-        files.append(self.write_file(
+        pairs.append((
             domain_dir / 'events' / f'{self.module_name}_created.go',
             self._event_template()
         ))
 
         # UseCase
-        files.append(self.write_file(
+        pairs.append((
             domain_dir / 'usecases' / f'{self.module_name}_usecases.go',
             self._usecase_constructor_template()
         ))
-        files.append(self.write_file(
-            domain_dir / 'usecases' / f'{self.module_name}_create.go',
-            self._usecase_create_template()
-        ))
-        files.append(self.write_file(
-            domain_dir / 'usecases' / f'{self.module_name}_query.go',
-            self._usecase_query_template()
-        ))
+        if 'create' in self.ops:
+            pairs.append((
+                domain_dir / 'usecases' / f'{self.module_name}_create.go',
+                self._usecase_create_template()
+            ))
+        if self.ops & {'read', 'list', 'update', 'delete'}:
+            pairs.append((
+                domain_dir / 'usecases' / f'{self.module_name}_query.go',
+                self._usecase_query_template()
+            ))
 
         # --- Infrastructure Layer ---
 
         # GORM Model
-        files.append(self.write_file(
+        pairs.append((
             base / 'models' / f'{self.module_name}.go',
             self._model_template()
         ))
 
         # Store implementation
-        files.append(self.write_file(
+        pairs.append((
             base / 'infrastructure' / 'database' / f'{self.domain_name}_{self.module_name}_store.go',
             self._store_template()
         ))
@@ -179,32 +340,36 @@ class GoGenerator(BaseGenerator):
         # --- Application Layer ---
 
         # Handler
-        files.append(self.write_file(
+        pairs.append((
             base / 'application' / 'ports' / 'http' / f'{self.module_name}_handler.go',
             self._handler_template()
         ))
 
         # DTOs
-        files.append(self.write_file(
+        pairs.append((
             base / 'application' / 'ports' / 'http' / f'{self.module_name}_dtos.go',
             self._dtos_template()
         ))
 
         # Service
-        files.append(self.write_file(
+        pairs.append((
             base / 'application' / 'services' / f'{self.module_name}_service.go',
             self._service_template()
         ))
 
-        return files
+        return pairs
 
     # --- Domain Layer Templates ---
 
     def _entity_template(self) -> str:
-        fields_str = '\n'.join([
-            f'\t{self.to_pascal_case(n)} {t} `json:"{n}"`'
-            for n, t, r in self.fields
-        ])
+        entity = self.entity_name
+        struct_fields, params, assigns = [], [], []
+        for f in self.fields:
+            struct_fields.append(f'\t{f.pascal} {f.type} `json:"{f.name}"`')
+            if f.required:
+                params.append(f'{f.camel} {f.type}')
+                assigns.append(f'\t\t{f.pascal}: {f.camel},')
+        fields_str = '\n'.join(struct_fields)
         return f'''package entities
 
 import (
@@ -213,30 +378,30 @@ import (
 	"github.com/google/uuid"
 )
 
-type {self.entity_name} struct {{
+type {entity} struct {{
 	ID        string    `json:"id"`
 {fields_str}
 	CreatedAt time.Time `json:"created_at"`
 	UpdatedAt time.Time `json:"updated_at"`
 }}
 
-func New{self.entity_name}({', '.join([f'{self.to_camel_case(n)} {t}' for n, t, r in self.fields if r])}) *{self.entity_name} {{
-	return &{self.entity_name}{{
+func New{entity}({', '.join(params)}) *{entity} {{
+	return &{entity}{{
 		ID:        uuid.New().String(),
-{chr(10).join([f'		{self.to_pascal_case(n)}: {self.to_camel_case(n)},' for n, _, r in self.fields if r])}
+{chr(10).join(assigns)}
 		CreatedAt: time.Now(),
 		UpdatedAt: time.Now(),
 	}}
 }}
 
-func (e *{self.entity_name}) IsValid() bool {{
+func (e *{entity}) IsValid() bool {{
 	return e.ID != ""
 }}
 '''
 
     def _value_object_template(self) -> str:
-        status_field = next((n for n, _, _ in self.fields if n == 'status' or n.endswith('_status')), 'status')
-        pascal = self.to_pascal_case(self.module_name)
+        status_field = next((f.name for f in self.fields if f.name == 'status' or f.name.endswith('_status')), 'status')
+        pascal = self.entity_name
         return f'''package valueobjects
 
 type {pascal}Status string
@@ -271,6 +436,7 @@ func (s {pascal}Status) CanTransitionTo(target {pascal}Status) bool {{
 '''
 
     def _port_template(self) -> str:
+        entity = self.entity_name
         return f'''package ports
 
 import (
@@ -279,15 +445,15 @@ import (
 	"{self.project}/internal/domain/{self.domain_name}/entities"
 )
 
-type {self.entity_name}Store interface {{
-	Create(ctx context.Context, entity *entities.{self.entity_name}) error
-	GetByID(ctx context.Context, id string) (*entities.{self.entity_name}, error)
-	Update(ctx context.Context, entity *entities.{self.entity_name}) error
+type {entity}Store interface {{
+	Create(ctx context.Context, entity *entities.{entity}) error
+	GetByID(ctx context.Context, id string) (*entities.{entity}, error)
+	Update(ctx context.Context, entity *entities.{entity}) error
 	Delete(ctx context.Context, id string) error
-	List(ctx context.Context, params *{self.entity_name}ListParams) ([]*entities.{self.entity_name}, int64, error)
+	List(ctx context.Context, params *{entity}ListParams) ([]*entities.{entity}, int64, error)
 }}
 
-type {self.entity_name}ListParams struct {{
+type {entity}ListParams struct {{
 	Page    int
 	PerPage int
 	Search  string
@@ -295,44 +461,51 @@ type {self.entity_name}ListParams struct {{
 '''
 
     def _event_template(self) -> str:
+        entity = self.entity_name
         return f'''package events
 
-type {self.entity_name}Created struct {{
+type {entity}Created struct {{
 	ID     string
 	UserID string
 }}
 
-func New{self.entity_name}Created(id, userID string) *{self.entity_name}Created {{
-	return &{self.entity_name}Created{{
+func New{entity}Created(id, userID string) *{entity}Created {{
+	return &{entity}Created{{
 		ID:     id,
 		UserID: userID,
 	}}
 }}
 
-func (e *{self.entity_name}Created) EventName() string {{
+func (e *{entity}Created) EventName() string {{
 	return "{self.domain_name}.{self.module_name}.created"
 }}
 '''
 
     def _usecase_constructor_template(self) -> str:
+        entity = self.entity_name
         return f'''package usecases
 
 import (
 	"{self.project}/internal/domain/{self.domain_name}/ports"
 )
 
-type {self.entity_name}Usecases struct {{
-	store ports.{self.entity_name}Store
+type {entity}Usecases struct {{
+	store ports.{entity}Store
 }}
 
-func New{self.entity_name}Usecases(store ports.{self.entity_name}Store) *{self.entity_name}Usecases {{
-	return &{self.entity_name}Usecases{{store: store}}
+func New{entity}Usecases(store ports.{entity}Store) *{entity}Usecases {{
+	return &{entity}Usecases{{store: store}}
 }}
 '''
 
     def _usecase_create_template(self) -> str:
-        params = ', '.join([f'{self.to_camel_case(n)} {t}' for n, t, r in self.fields if r])
-        args = ', '.join([self.to_camel_case(n) for n, _, r in self.fields if r])
+        entity = self.entity_name
+        params, args = [], []
+        for f in self.fields:
+            if f.required:
+                params.append(f'{f.camel} {f.type}')
+                args.append(f.camel)
+        params, args = ', '.join(params), ', '.join(args)
         return f'''package usecases
 
 import (
@@ -341,8 +514,8 @@ import (
 	"{self.project}/internal/domain/{self.domain_name}/entities"
 )
 
-func (u *{self.entity_name}Usecases) Create(ctx context.Context, {params}) (*entities.{self.entity_name}, error) {{
-	entity := entities.New{self.entity_name}({args})
+func (u *{entity}Usecases) Create(ctx context.Context, {params}) (*entities.{entity}, error) {{
+	entity := entities.New{entity}({args})
 	if err := u.store.Create(ctx, entity); err != nil {{
 		return nil, err
 	}}
@@ -351,34 +524,37 @@ func (u *{self.entity_name}Usecases) Create(ctx context.Context, {params}) (*ent
 '''
 
     def _usecase_query_template(self) -> str:
-        return f'''package usecases
-
-import (
-	"context"
-
-	"{self.project}/internal/domain/{self.domain_name}/entities"
-	"{self.project}/internal/domain/{self.domain_name}/ports"
-)
-
-func (u *{self.entity_name}Usecases) GetByID(ctx context.Context, id string) (*entities.{self.entity_name}, error) {{
+        ops = self.ops
+        entity = self.entity_name
+        blocks = []
+        if ops & {'read', 'update'}:
+            blocks.append(f'''func (u *{entity}Usecases) GetByID(ctx context.Context, id string) (*entities.{entity}, error) {{
 	return u.store.GetByID(ctx, id)
-}}
-
-func (u *{self.entity_name}Usecases) List(ctx context.Context, params *ports.{self.entity_name}ListParams) ([]*entities.{self.entity_name}, int64, error) {{
+}}''')
+        if 'list' in ops:
+            blocks.append(f'''func (u *{entity}Usecases) List(ctx context.Context, params *ports.{entity}ListParams) ([]*entities.{entity}, int64, error) {{
 	return u.store.List(ctx, params)
-}}
-
-func (u *{self.entity_name}Usecases) Delete(ctx context.Context, id string) error {{
+}}''')
+        if 'delete' in ops:
+            blocks.append(f'''func (u *{entity}Usecases) Delete(ctx context.Context, id string) error {{
 	return u.store.Delete(ctx, id)
-}}
-'''
+}}''')
+        domain_pkg = f'{self.project}/internal/domain/{self.domain_name}'
+        domain_imports = []
+        if ops & {'read', 'update', 'list'}:
+            domain_imports.append(f'"{domain_pkg}/entities"')
+        if 'list' in ops:
+            domain_imports.append(f'"{domain_pkg}/ports"')
+        return self._go_source('usecases', [['"context"'], domain_imports], blocks)
 
     # --- Infrastructure Layer Templates ---
 
     def _model_template(self) -> str:
+        entity = self.entity_name
+        gorm = _GORM_GET
         fields_str = '\n'.join([
-            f'\t{self.to_pascal_case(n)} {t if r or t.startswith("*") else "*"+t} `gorm:"type:{self._gorm_type(t)}" json:"{n}"`'
-            for n, t, r in self.fields
+            f'\t{f.pascal} {f.storage_type} `gorm:"type:{gorm(f.type, "varchar(255)")}" json:"{f.name}"`'
+            for f in self.fields
         ])
         return f'''package models
 
@@ -389,7 +565,7 @@ import (
 	"gorm.io/gorm"
 )
 
-type {self.entity_name} struct {{
+type {entity} struct {{
 	ID        string         `gorm:"type:char(36);primaryKey" json:"id"`
 {fields_str}
 	CreatedAt time.Time      `json:"created_at"`
@@ -397,7 +573,7 @@ type {self.entity_name} struct {{
 	DeletedAt gorm.DeletedAt `gorm:"index" json:"-"`
 }}
 
-func (e *{self.entity_name}) BeforeCreate(tx *gorm.DB) error {{
+func (e *{entity}) BeforeCreate(tx *gorm.DB) error {{
 	if e.ID == "" {{
 		e.ID = uuid.New().String()
 	}}
@@ -406,9 +582,13 @@ func (e *{self.entity_name}) BeforeCreate(tx *gorm.DB) error {{
 '''
 
     def _store_template(self) -> str:
-        search_field = next((n for n, t, _ in self.fields if t == 'string' and not n.endswith('_id')), 'name')
-        entity_mappings = '\n'.join([f'\t\t{self.to_pascal_case(n)}: entity.{self.to_pascal_case(n)},' for n, _, _ in self.fields])
-        model_mappings = '\n'.join([f'\t\t{self.to_pascal_case(n)}: m.{self.to_pascal_case(n)},' for n, _, _ in self.fields])
+        entity = self.entity_name
+        search_field = next((f.name for f in self.fields if f.type == 'string' and not f.name.endswith('_id')), 'name')
+        entity_mappings, model_mappings = [], []
+        for f in self.fields:
+            entity_mappings.append(f'\t\t{f.pascal}: entity.{f.pascal},')
+            model_mappings.append(f'\t\t{f.pascal}: m.{f.pascal},')
+        entity_mappings, model_mappings = '\n'.join(entity_mappings), '\n'.join(model_mappings)
         return f'''package database
 
 import (
@@ -421,42 +601,42 @@ import (
 	"{self.project}/internal/models"
 )
 
-var _ ports.{self.entity_name}Store = (*{self.entity_name}Store)(nil)
+var _ ports.{entity}Store = (*{entity}Store)(nil)
 
-type {self.entity_name}Store struct {{
+type {entity}Store struct {{
 	db *gorm.DB
 }}
 
-func New{self.entity_name}Store(db *gorm.DB) *{self.entity_name}Store {{
-	return &{self.entity_name}Store{{db: db}}
+func New{entity}Store(db *gorm.DB) *{entity}Store {{
+	return &{entity}Store{{db: db}}
 }}
 
-func (s *{self.entity_name}Store) Create(ctx context.Context, entity *entities.{self.entity_name}) error {{
+func (s *{entity}Store) Create(ctx context.Context, entity *entities.{entity}) error {{
 	m := s.toModel(entity)
 	return s.db.WithContext(ctx).Create(m).Error
 }}
 
-func (s *{self.entity_name}Store) GetByID(ctx context.Context, id string) (*entities.{self.entity_name}, error) {{
-	var m models.{self.entity_name}
+func (s *{entity}Store) GetByID(ctx context.Context, id string) (*entities.{entity}, error) {{
+	var m models.{entity}
 	if err := s.db.WithContext(ctx).First(&m, "id = ?", id).Error; err != nil {{
 		return nil, err
 	}}
 	return s.toEntity(&m), nil
 }}
 
-func (s *{self.entity_name}Store) Update(ctx context.Context, entity *entities.{self.entity_name}) error {{
+func (s *{entity}Store) Update(ctx context.Context, entity *entities.{entity}) error {{
 	m := s.toModel(entity)
 	return s.db.WithContext(ctx).Save(m).Error
 }}
 
-func (s *{self.entity_name}Store) Delete(ctx context.Context, id string) error {{
-	return s.db.WithContext(ctx).Delete(&models.{self.entity_name}{{}}, "id = ?", id).Error
+func (s *{entity}Store) Delete(ctx context.Context, id string) error {{
+	return s.db.WithContext(ctx).Delete(&models.{entity}{{}}, "id = ?", id).Error
 }}
 
-func (s *{self.entity_name}Store) List(ctx context.Context, params *ports.{self.entity_name}ListParams) ([]*entities.{self.entity_name}, int64, error) {{
-	var items []models.{self.entity_name}
+func (s *{entity}Store) List(ctx context.Context, params *ports.{entity}ListParams) ([]*entities.{entity}, int64, error) {{
+	var items []models.{entity}
 	var total int64
-	query := s.db.WithContext(ctx).Model(&models.{self.entity_name}{{}})
+	query := s.db.WithContext(ctx).Model(&models.{entity}{{}})
 	if params.Search != "" {{
 		query = query.Where("{search_field} LIKE ?", "%"+params.Search+"%")
 	}}
@@ -470,15 +650,15 @@ func (s *{self.entity_name}Store) List(ctx context.Context, params *ports.{self.
 	if err := query.Offset(offset).Limit(perPage).Order("created_at DESC").Find(&items).Error; err != nil {{
 		return nil, 0, err
 	}}
-	result := make([]*entities.{self.entity_name}, len(items))
+	result := make([]*entities.{entity}, len(items))
 	for i := range items {{
 		result[i] = s.toEntity(&items[i])
 	}}
 	return result, total, nil
 }}
 
-func (s *{self.entity_name}Store) toModel(entity *entities.{self.entity_name}) *models.{self.entity_name} {{
-	return &models.{self.entity_name}{{
+func (s *{entity}Store) toModel(entity *entities.{entity}) *models.{entity} {{
+	return &models.{entity}{{
 		ID:        entity.ID,
 {entity_mappings}
 		CreatedAt: entity.CreatedAt,
@@ -486,8 +666,8 @@ func (s *{self.entity_name}Store) toModel(entity *entities.{self.entity_name}) *
 	}}
 }}
 
-func (s *{self.entity_name}Store) toEntity(m *models.{self.entity_name}) *entities.{self.entity_name} {{
-	return &entities.{self.entity_name}{{
+func (s *{entity}Store) toEntity(m *models.{entity}) *entities.{entity} {{
+	return &entities.{entity}{{
 		ID:        m.ID,
 {model_mappings}
 		CreatedAt: m.CreatedAt,
@@ -499,43 +679,25 @@ func (s *{self.entity_name}Store) toEntity(m *models.{self.entity_name}) *entiti
     # --- Application Layer Templates ---
 
     def _handler_template(self) -> str:
-        route = self.to_kebab_case(self.pluralize(self.module_name))
-        return f'''package http
-
-import (
-	"net/http"
-
-	"github.com/gin-gonic/gin"
-
-	"{self.project}/internal/application/services"
-	"{self.project}/internal/bootstrap"
-	"{self.project}/internal/domain/{self.domain_name}/usecases"
-	"{self.project}/internal/infrastructure/database"
-	infrahttp "{self.project}/internal/infrastructure/http"
-)
-
-type {self.entity_name}Handler struct {{
-	service *services.{self.entity_name}Service
-}}
-
-func Register{self.entity_name}Routes(r gin.IRouter, app *bootstrap.App) {{
-	store := database.New{self.entity_name}Store(app.DB)
-	uc := usecases.New{self.entity_name}Usecases(store)
-	svc := services.New{self.entity_name}Service(uc)
-	h := &{self.entity_name}Handler{{service: svc}}
-
-	group := r.Group("/{route}")
+        ops = self.ops
+        entity = self.entity_name
+        routes = '\n'.join([line for op, line in _GO_ROUTES if op in ops])
+        blocks = [f'''type {entity}Handler struct {{
+	service *services.{entity}Service
+}}''', f'''func Register{entity}Routes(r gin.IRouter, app *bootstrap.App) {{
+	store := database.New{entity}Store(app.DB)
+	uc := usecases.New{entity}Usecases(store)
+	svc := services.New{entity}Service(uc)
+	h := &{entity}Handler{{service: svc}}
+
+	group := r.Group("/{self.route}")
 	{{
-		group.POST("", h.Create)
-		group.GET("", h.List)
-		group.GET("/:id", h.GetByID)
-		group.PUT("/:id", h.Update)
-		group.DELETE("/:id", h.Delete)
+{routes}
 	}}
-}}
-
-func (h *{self.entity_name}Handler) Create(c *gin.Context) {{
-	var req Create{self.entity_name}Request
+}}''']
+        if 'create' in ops:
+            blocks.append(f'''func (h *{entity}Handler) Create(c *gin.Context) {{
+	var req Create{entity}Request
 	if err := c.ShouldBindJSON(&req); err != nil {{
 		infrahttp.Error(c, http.StatusBadRequest, "Invalid request: "+err.Error())
 		return
@@ -546,19 +708,19 @@ func (h *{self.entity_name}Handler) Create(c *gin.Context) {{
 		return
 	}}
 	infrahttp.Success(c, entity)
-}}
-
-func (h *{self.entity_name}Handler) GetByID(c *gin.Context) {{
+}}''')
+        if 'read' in ops:
+            blocks.append(f'''func (h *{entity}Handler) GetByID(c *gin.Context) {{
 	entity, err := h.service.GetByID(c, c.Param("id"))
 	if err != nil {{
-		infrahttp.Error(c, http.StatusNotFound, "{self.entity_name} not found")
+		infrahttp.Error(c, http.StatusNotFound, "{entity} not found")
 		return
 	}}
 	infrahttp.Success(c, entity)
-}}
-
-func (h *{self.entity_name}Handler) Update(c *gin.Context) {{
-	var req Update{self.entity_name}Request
+}}''')
+        if 'update' in ops:
+            blocks.append(f'''func (h *{entity}Handler) Update(c *gin.Context) {{
+	var req Update{entity}Request
 	if err := c.ShouldBindJSON(&req); err != nil {{
 		infrahttp.Error(c, http.StatusBadRequest, "Invalid request: "+err.Error())
 		return
@@ -569,18 +731,18 @@ func (h *{self.entity_name}Handler) Update(c *gin.Context) {{
 		return
 	}}
 	infrahttp.Success(c, entity)
-}}
-
-func (h *{self.entity_name}Handler) Delete(c *gin.Context) {{
+}}''')
+        if 'delete' in ops:
+            blocks.append(f'''func (h *{entity}Handler) Delete(c *gin.Context) {{
 	if err := h.service.Delete(c, c.Param("id")); err != nil {{
 		infrahttp.HandleError(c, err)
 		return
 	}}
 	infrahttp.Success(c, gin.H{{"deleted": true}})
-}}
-
-func (h *{self.entity_name}Handler) List(c *gin.Context) {{
-	var req List{self.entity_name}Request
+}}''')
+        if 'list' in ops:
+            blocks.append(f'''func (h *{entity}Handler) List(c *gin.Context) {{
+	var req List{entity}Request
 	if err := c.ShouldBindQuery(&req); err != nil {{
 		infrahttp.Error(c, http.StatusBadRequest, "Invalid request: "+err.Error())
 		return
@@ -591,65 +753,62 @@ func (h *{self.entity_name}Handler) List(c *gin.Context) {{
 		return
 	}}
 	infrahttp.Success(c, result)
-}}
-'''
+}}''')
+        return self._go_source('http', [
+            ['"net/http"'] if ops - {'delete'} else [],
+            ['"github.com/gin-gonic/gin"'],
+            [
+                f'"{self.project}/internal/application/services"',
+                f'"{self.project}/internal/bootstrap"',
+                f'"{self.project}/internal/domain/{self.domain_name}/usecases"',
+                f'"{self.project}/internal/infrastructure/database"',
+                f'infrahttp "{self.project}/internal/infrastructure/http"',
+            ],
+        ], blocks)
 
     def _dtos_template(self) -> str:
-        create_fields = '\n'.join([
-            f'\t{self.to_pascal_case(n)} {t} `json:"{n}" binding:"{"required" if r else "omitempty"}"`'
-            for n, t, r in self.fields
-        ])
-        update_fields = '\n'.join([
-            f'\t{self.to_pascal_case(n)} *{t.lstrip("*")} `json:"{n}"`'
-            for n, t, _ in self.fields
-        ])
-        return f'''package http
-
-type Create{self.entity_name}Request struct {{
-{create_fields}
-}}
-
-type Update{self.entity_name}Request struct {{
-{update_fields}
-}}
-
-type List{self.entity_name}Request struct {{
+        ops = self.ops
+        entity = self.entity_name
+        create_fields, update_fields = [], []
+        for f in self.fields:
+            create_fields.append(f'\t{f.pascal} {f.type} `json:"{f.name}" binding:"{"required" if f.required else "omitempty"}"`')
+            update_fields.append(f'\t{f.pascal} *{f.type.lstrip("*")} `json:"{f.name}"`')
+        blocks = []
+        if 'create' in ops:
+            blocks.append(f'''type Create{entity}Request struct {{
+{chr(10).join(create_fields)}
+}}''')
+        if 'update' in ops:
+            blocks.append(f'''type Update{entity}Request struct {{
+{chr(10).join(update_fields)}
+}}''')
+        if 'list' in ops:
+            blocks.append(f'''type List{entity}Request struct {{
 	Page    int    `form:"page" binding:"omitempty,min=1"`
 	PerPage int    `form:"per_page" binding:"omitempty,min=1,max=100"`
 	Search  string `form:"search"`
-}}
-'''
+}}''')
+        return self._go_source('http', [], blocks)
 
     def _service_template(self) -> str:
-        create_args = ', '.join([f'req.{self.to_pascal_case(n)}' for n, _, r in self.fields if r])
-        return f'''package services
-
-import (
-	"context"
-
-	"{self.project}/internal/domain/{self.domain_name}/entities"
-	"{self.project}/internal/domain/{self.domain_name}/ports"
-	"{self.project}/internal/domain/{self.domain_name}/usecases"
-	apphttp "{self.project}/internal/application/ports/http"
-)
-
-type {self.entity_name}Service struct {{
-	usecases *usecases.{self.entity_name}Usecases
-}}
-
-func New{self.entity_name}Service(uc *usecases.{self.entity_name}Usecases) *{self.entity_name}Service {{
-	return &{self.entity_name}Service{{usecases: uc}}
-}}
-
-func (s *{self.entity_name}Service) Create(ctx context.Context, req *apphttp.Create{self.entity_name}Request) (*entities.{self.entity_name}, error) {{
+        ops = self.ops
+        entity = self.entity_name
+        blocks = [f'''type {entity}Service struct {{
+	usecases *usecases.{entity}Usecases
+}}''', f'''func New{entity}Service(uc *usecases.{entity}Usecases) *{entity}Service {{
+	return &{entity}Service{{usecases: uc}}
+}}''']
+        if 'create' in ops:
+            create_args = ', '.join([f'req.{f.pascal}' for f in self.fields if f.required])
+            blocks.append(f'''func (s *{entity}Service) Create(ctx context.Context, req *apphttp.Create{entity}Request) (*entities.{entity}, error) {{
 	return s.usecases.Create(ctx, {create_args})
-}}
-
-func (s *{self.entity_name}Service) GetByID(ctx context.Context, id string) (*entities.{self.entity_name}, error) {{
+}}''')
+        if 'read' in ops:
+            blocks.append(f'''func (s *{entity}Service) GetByID(ctx context.Context, id string) (*entities.{entity}, error) {{
 	return s.usecases.GetByID(ctx, id)
-}}
-
-func (s *{self.entity_name}Service) Update(ctx context.Context, id string, req *apphttp.Update{self.entity_name}Request) (*entities.{self.entity_name}, error) {{
+}}''')
+        if 'update' in ops:
+            blocks.append(f'''func (s *{entity}Service) Update(ctx context.Context, id string, req *apphttp.Update{entity}Request) (*entities.{entity}, error) {{
 	entity, err := s.usecases.GetByID(ctx, id)
 	if err != nil {{
 		return nil, err
@@ -657,88 +816,97 @@ func (s *{self.entity_name}Service) Update(ctx context.Context, id string, req *
 	// TODO: Apply updates from req to entity
 	_ = entity
 	return entity, nil
-}}
-
-func (s *{self.entity_name}Service) Delete(ctx context.Context, id string) error {{
+}}''')
+        if 'delete' in ops:
+            blocks.append(f'''func (s *{entity}Service) Delete(ctx context.Context, id string) error {{
 	return s.usecases.Delete(ctx, id)
-}}
-
-func (s *{self.entity_name}Service) List(ctx context.Context, req *apphttp.List{self.entity_name}Request) ([]*entities.{self.entity_name}, error) {{
-	params := &ports.{self.entity_name}ListParams{{
+}}''')
+        if 'list' in ops:
+            blocks.append(f'''func (s *{entity}Service) List(ctx context.Context, req *apphttp.List{entity}Request) ([]*entities.{entity}, error) {{
+	params := &ports.{entity}ListParams{{
 		Page:    req.Page,
 		PerPage: req.PerPage,
 		Search:  req.Search,
 	}}
 	items, _, err := s.usecases.List(ctx, params)
 	return items, err
-}}
-'''
-
+}}''')
+        domain_pkg = f'{self.project}/internal/domain/{self.domain_name}'
+        imports = []
+        if ops - {'delete'}:
+            imports.append(f'"{domain_pkg}/entities"')
+        if 'list' in ops:
+            imports.append(f'"{domain_pkg}/ports"')
+        imports.append(f'"{domain_pkg}/usecases"')
+        if ops & {'create', 'update', 'list'}:
+            imports.append(f'apphttp "{self.project}/internal/application/ports/http"')
+        return self._go_source('services', [['"context"'], imports], blocks)
+
+    def _go_source(self, package: str, import_groups: List[List[str]], blocks: List[str]) -> str:
+        """Assemble a Go file from import groups and top-level blocks, dropping empty groups"""
+        groups = ['\n'.join([f'\t{imp}' for imp in group]) for group in import_groups if group]
+        imports = 'import (\n' + '\n\n'.join(groups) + '\n)\n\n' if groups else ''
+        return (f'package {package}\n\n' + imports + '\n\n'.join(blocks)).rstrip('\n') + '\n'
 
 # =============================================================================
 # LARAVEL DDD GENERATOR
 # =============================================================================
 
+_MIGRATION_TYPE_MAP = {
+    'string': 'string', 'text': 'text', 'integer': 'integer',
+    'bigInteger': 'bigInteger', 'float': 'float', 'double': 'double',
+    'decimal': 'decimal', 'boolean': 'boolean', 'date': 'date',
+    'datetime': 'dateTime', 'timestamp': 'timestamp', 'json': 'json',
+}
+_MIGRATION_GET = _MIGRATION_TYPE_MAP.get
+
+_PHP_TYPE_MAP = {
+    'string': 'string', 'text': 'string', 'integer': 'int',
+    'bigInteger': 'int', 'float': 'float', 'double': 'float',
+    'decimal': 'float', 'boolean': 'bool', 'date': 'string',
+    'datetime': 'string', 'json': 'array',
+}
+_PHP_GET = _PHP_TYPE_MAP.get
+
+
 class LaravelGenerator(BaseGenerator):
     """Laravel + PHP DDD generator"""
 
-    def parse_fields(self, fields_str: str) -> List[Tuple[str, str, bool]]:
-        fields = []
-        for field in fields_str.split(','):
-            field = field.strip()
-            if not field:
-                continue
-            required = not field.endswith('?')
-            field = field.rstrip('?')
-            if ':' in field:
-                name, php_type = field.split(':', 1)
-            else:
-                name, php_type = field, 'string'
-            fields.append((name.strip(), php_type.strip(), required))
-        return fields
-
-    def _migration_type(self, php_type: str) -> str:
-        type_map = {
-            'string': 'string', 'text': 'text', 'integer': 'integer',
-            'bigInteger': 'bigInteger', 'float': 'float', 'double': 'double',
-            'decimal': 'decimal', 'boolean': 'boolean', 'date': 'date',
-            'datetime': 'dateTime', 'timestamp': 'timestamp', 'json': 'json',
-        }
-        return type_map.get(php_type, 'string')
+    __slots__ = ()
 
-    def generate(self) -> List[str]:
-        files = []
+    def render_files(self) -> List[Tuple[Path, str]]:
+        pairs = []
         base = self.output_dir / 'app'
 
         # --- Domain Layer ---
         domain_dir = base / 'Domain' / self.domain_pascal
 
         # Entity
-        files.append(self.write_file(
+        pairs.append((
             domain_dir / 'Entities' / f'{self.entity_name}.php',
             self._entity_template()
         ))
 
         # Port
-        files.append(self.write_file(
+        pairs.append((
             domain_dir / 'Ports' / f'{self.entity_name}StorePort.php',
             self._port_template()
         ))
 
         # UseCase - Create
-        files.append(self.write_file(
+        pairs.append((
             domain_dir / 'UseCases' / f'Create{self.entity_name}UseCase.php',
             self._create_usecase_template()
         ))
 
         # UseCase - Update
-        files.append(self.write_file(
+        pairs.append((
             domain_dir / 'UseCases' / f'Update{self.entity_name}UseCase.php',
             self._update_usecase_template()
         ))
 
         # UseCase - Delete
-        files.append(self.write_file(
+        pairs.append((
             domain_dir / 'UseCases' / f'Delete{self.entity_name}UseCase.php',
             self._delete_usecase_template()
         ))
@@ -746,58 +914,60 @@ class LaravelGenerator(BaseGenerator):
         # --- Infrastructure Layer ---
 
         # Eloquent Model
-        files.append(self.write_file(
+        pairs.append((
             base / 'Models' / f'{self.entity_name}.php',
             self._model_template()
         ))
 
         # Repository implementation
-        files.append(self.write_file(
+        pairs.append((
             base / 'Infrastructure' / 'Repositories' / f'Eloquent{self.entity_name}Repository.php',
             self._repository_template()
         ))
 
         # Migration
-        files.append(self.write_file(
-            self.output_dir / 'database' / 'migrations' / f'create_{self.pluralize(self.module_name)}_table.php',
+        pairs.append((
+            self.output_dir / 'database' / 'migrations' / f'create_{self.plural_name}_table.php',
             self._migration_template()
         ))
 
         # --- Application Layer ---
 
         # Controller
-        files.append(self.write_file(
+        pairs.append((
             base / 'Application' / 'Http' / 'Controllers' / f'{self.entity_name}Controller.php',
             self._controller_template()
         ))
 
         # Service
-        files.append(self.write_file(
+        pairs.append((
             base / 'Application' / 'Services' / f'{self.entity_name}Service.php',
             self._service_template()
         ))
 
         # Service Provider
-        files.append(self.write_file(
+        pairs.append((
             base / 'Providers' / f'{self.domain_pascal}ServiceProvider.php',
             self._provider_template()
         ))
 
         # Request
-        files.append(self.write_file(
+        pairs.append((
             base / 'Application' / 'Http' / 'Requests' / f'{self.entity_name}Request.php',
             self._request_template()
         ))
 
-        return files
+        return pairs
 
     # --- Domain Layer Templates ---
 
     def _entity_template(self) -> str:
-        props = '\n'.join([
-            f"    public readonly {'?' if not r else ''}{self._php_type(t)} ${n},"
-            for n, t, r in self.fields
-        ])
+        php_type = _PHP_GET
+        props, names = [], []
+        for f in self.fields:
+            props.append(f"    public readonly {'?' if not f.required else ''}{php_type(f.type, 'string')} ${f.name},")
+            names.append(f"'{f.name}'")
+        props, names = '\n'.join(props), ', '.join(names)
         return f'''<?php
 
 namespace App\\Domain\\{self.domain_pascal}\\Entities;
@@ -815,7 +985,7 @@ class {self.entity_name}
     {{
         return new self(
             id: (string) \\Illuminate\\Support\\Str::uuid(),
-            ...array_intersect_key($data, array_flip([{', '.join([f"'{n}'" for n, _, _ in self.fields])}])),
+            ...array_intersect_key($data, array_flip([{names}])),
         );
     }}
 
@@ -826,112 +996,80 @@ class {self.entity_name}
 }}
 '''
 
-    def _php_type(self, field_type: str) -> str:
-        type_map = {
-            'string': 'string', 'text': 'string', 'integer': 'int',
-            'bigInteger': 'int', 'float': 'float', 'double': 'float',
-            'decimal': 'float', 'boolean': 'bool', 'date': 'string',
-            'datetime': 'string', 'json': 'array',
-        }
-        return type_map.get(field_type, 'string')
-
     def _port_template(self) -> str:
+        entity = self.entity_name
         return f'''<?php
 
 namespace App\\Domain\\{self.domain_pascal}\\Ports;
 
-use App\\Domain\\{self.domain_pascal}\\Entities\\{self.entity_name};
+use App\\Domain\\{self.domain_pascal}\\Entities\\{entity};
 
-interface {self.entity_name}StorePort
+interface {entity}StorePort
 {{
-    public function create({self.entity_name} $entity): {self.entity_name};
-    public function findById(string $id): ?{self.entity_name};
-    public function update({self.entity_name} $entity): {self.entity_name};
+    public function create({entity} $entity): {entity};
+    public function findById(string $id): ?{entity};
+    public function update({entity} $entity): {entity};
     public function delete(string $id): bool;
     public function list(array $params = []): array;
 }}
 '''
 
-    def _create_usecase_template(self) -> str:
+    def _usecase_template(self, verb: str, signature: str, return_type: str, body: str, uses_entity: bool = True) -> str:
+        """Shared skeleton of the Create/Update/Delete use cases"""
+        domain, entity = self.domain_pascal, self.entity_name
+        entity_use = f'use App\\Domain\\{domain}\\Entities\\{entity};\n' if uses_entity else ''
         return f'''<?php
 
-namespace App\\Domain\\{self.domain_pascal}\\UseCases;
+namespace App\\Domain\\{domain}\\UseCases;
 
-use App\\Domain\\{self.domain_pascal}\\Entities\\{self.entity_name};
-use App\\Domain\\{self.domain_pascal}\\Ports\\{self.entity_name}StorePort;
+{entity_use}use App\\Domain\\{domain}\\Ports\\{entity}StorePort;
 
-class Create{self.entity_name}UseCase
+class {verb}{entity}UseCase
 {{
     public function __construct(
-        private readonly {self.entity_name}StorePort $store,
+        private readonly {entity}StorePort $store,
     ) {{}}
 
-    public function execute(array $data): {self.entity_name}
+    public function execute({signature}): {return_type}
     {{
-        $entity = {self.entity_name}::create($data);
-        return $this->store->create($entity);
+{body}
     }}
 }}
 '''
 
-    def _update_usecase_template(self) -> str:
-        return f'''<?php
-
-namespace App\\Domain\\{self.domain_pascal}\\UseCases;
-
-use App\\Domain\\{self.domain_pascal}\\Entities\\{self.entity_name};
-use App\\Domain\\{self.domain_pascal}\\Ports\\{self.entity_name}StorePort;
-
-class Update{self.entity_name}UseCase
-{{
-    public function __construct(
-        private readonly {self.entity_name}StorePort $store,
-    ) {{}}
+    def _create_usecase_template(self) -> str:
+        return self._usecase_template('Create', 'array $data', self.entity_name, f'''        $entity = {self.entity_name}::create($data);
+        return $this->store->create($entity);''')
 
-    public function execute(string $id, array $data): {self.entity_name}
-    {{
-        $entity = $this->store->findById($id);
+    def _update_usecase_template(self) -> str:
+        entity = self.entity_name
+        names = ', '.join([f"'{f.name}'" for f in self.fields])
+        return self._usecase_template('Update', 'string $id, array $data', self.entity_name, f'''        $entity = $this->store->findById($id);
         if (!$entity) {{
-            throw new \\RuntimeException("{self.entity_name} not found");
+            throw new \\RuntimeException("{entity} not found");
         }}
-        $updated = new {self.entity_name}(
+        $updated = new {entity}(
             id: $entity->id,
             ...array_merge(
-                array_intersect_key((array) $entity, array_flip([{', '.join([f"'{n}'" for n, _, _ in self.fields])}])),
+                array_intersect_key((array) $entity, array_flip([{names}])),
                 $data,
             ),
             createdAt: $entity->createdAt,
         );
-        return $this->store->update($updated);
-    }}
-}}
-'''
+        return $this->store->update($updated);''')
 
     def _delete_usecase_template(self) -> str:
-        return f'''<?php
-
-namespace App\\Domain\\{self.domain_pascal}\\UseCases;
-
-use App\\Domain\\{self.domain_pascal}\\Ports\\{self.entity_name}StorePort;
-
-class Delete{self.entity_name}UseCase
-{{
-    public function __construct(
-        private readonly {self.entity_name}StorePort $store,
-    ) {{}}
-
-    public function execute(string $id): bool
-    {{
-        return $this->store->delete($id);
-    }}
-}}
-'''
+        return self._usecase_template('Delete', 'string $id', 'bool', '        return $this->store->delete($id);', uses_entity=False)
 
     # --- Infrastructure Layer Templates ---
 
     def _model_template(self) -> str:
-        fillable = ', '.join([f"'{n}'" for n, _, _ in self.fields])
-        casts = ', '.join([f"'{n}' => '{t}'" for n, t, _ in self.fields if t in ('boolean', 'integer', 'float', 'array', 'json')])
+        fillable, casts = [], []
+        for f in self.fields:
+            fillable.append(f"'{f.name}'")
+            if f.type in ('boolean', 'integer', 'float', 'array', 'json'):
+                casts.append(f"'{f.name}' => '{f.type}'")
+        fillable, casts = ', '.join(fillable), ', '.join(casts)
         return f'''<?php
 
 namespace App\\Models;
@@ -952,48 +1090,53 @@ class {self.entity_name} extends Model
 '''
 
     def _repository_template(self) -> str:
-        entity_mappings = '\n'.join([f"            '{n}' => $model->{n}," for n, _, _ in self.fields])
+        entity = self.entity_name
+        entity_mappings, attributes = [], []
+        for f in self.fields:
+            entity_mappings.append(f"            '{f.name}' => $model->{f.name},")
+            attributes.append(f"            '{f.name}' => $entity->{f.name},")
+        entity_mappings, attributes = '\n'.join(entity_mappings), '\n'.join(attributes)
         return f'''<?php
 
 namespace App\\Infrastructure\\Repositories;
 
-use App\\Domain\\{self.domain_pascal}\\Entities\\{self.entity_name} as {self.entity_name}Entity;
-use App\\Domain\\{self.domain_pascal}\\Ports\\{self.entity_name}StorePort;
-use App\\Models\\{self.entity_name};
+use App\\Domain\\{self.domain_pascal}\\Entities\\{entity} as {entity}Entity;
+use App\\Domain\\{self.domain_pascal}\\Ports\\{entity}StorePort;
+use App\\Models\\{entity};
 
-class Eloquent{self.entity_name}Repository implements {self.entity_name}StorePort
+class Eloquent{entity}Repository implements {entity}StorePort
 {{
-    public function create({self.entity_name}Entity $entity): {self.entity_name}Entity
+    public function create({entity}Entity $entity): {entity}Entity
     {{
-        $model = {self.entity_name}::create([
-{chr(10).join([f"            '{n}' => $entity->{n}," for n, _, _ in self.fields])}
+        $model = {entity}::create([
+{attributes}
         ]);
         return $this->toEntity($model);
     }}
 
-    public function findById(string $id): ?{self.entity_name}Entity
+    public function findById(string $id): ?{entity}Entity
     {{
-        $model = {self.entity_name}::find($id);
+        $model = {entity}::find($id);
         return $model ? $this->toEntity($model) : null;
     }}
 
-    public function update({self.entity_name}Entity $entity): {self.entity_name}Entity
+    public function update({entity}Entity $entity): {entity}Entity
     {{
-        $model = {self.entity_name}::findOrFail($entity->id);
+        $model = {entity}::findOrFail($entity->id);
         $model->update([
-{chr(10).join([f"            '{n}' => $entity->{n}," for n, _, _ in self.fields])}
+{attributes}
         ]);
         return $this->toEntity($model->fresh());
     }}
 
     public function delete(string $id): bool
     {{
-        return (bool) {self.entity_name}::destroy($id);
+        return (bool) {entity}::destroy($id);
     }}
 
     public function list(array $params = []): array
     {{
-        $query = {self.entity_name}::query();
+        $query = {entity}::query();
         if (!empty($params['search'])) {{
             $query->where('name', 'like', '%' . $params['search'] . '%');
         }}
@@ -1008,9 +1151,9 @@ class Eloquent{self.entity_name}Repository implements {self.entity_name}StorePor
         ];
     }}
 
-    private function toEntity({self.entity_name} $model): {self.entity_name}Entity
+    private function toEntity({entity} $model): {entity}Entity
     {{
-        return new {self.entity_name}Entity(
+        return new {entity}Entity(
             id: $model->id,
 {entity_mappings}
             createdAt: $model->created_at?->toISOString(),
@@ -1021,10 +1164,11 @@ class Eloquent{self.entity_name}Repository implements {self.entity_name}StorePor
 '''
 
     def _migration_template(self) -> str:
-        table = self.pluralize(self.module_name)
+        table = self.plural_name
+        migration_type = _MIGRATION_GET
         columns = '\n'.join([
-            f"            $table->{self._migration_type(t)}('{n}'){'' if r else '->nullable()'};"
-            for n, t, r in self.fields
+            f"            $table->{migration_type(f.type, 'string')}('{f.name}'){'' if f.required else '->nullable()'};"
+            for f in self.fields
         ])
         return f'''<?php
 
@@ -1054,19 +1198,20 @@ return new class extends Migration
     # --- Application Layer Templates ---
 
     def _controller_template(self) -> str:
+        entity = self.entity_name
         return f'''<?php
 
 namespace App\\Application\\Http\\Controllers;
 
-use App\\Application\\Http\\Requests\\{self.entity_name}Request;
-use App\\Application\\Services\\{self.entity_name}Service;
+use App\\Application\\Http\\Requests\\{entity}Request;
+use App\\Application\\Services\\{entity}Service;
 use Illuminate\\Http\\JsonResponse;
 use Illuminate\\Http\\Request;
 
-class {self.entity_name}Controller
+class {entity}Controller
 {{
     public function __construct(
-        private readonly {self.entity_name}Service $service,
+        private readonly {entity}Service $service,
     ) {{}}
 
     public function index(Request $request): JsonResponse
@@ -1079,18 +1224,18 @@ class {self.entity_name}Controller
     {{
         $entity = $this->service->getById($id);
         if (!$entity) {{
-            return response()->json(['error' => '{self.entity_name} not found'], 404);
+            return response()->json(['error' => '{entity} not found'], 404);
         }}
         return response()->json($entity);
     }}
 
-    public function store({self.entity_name}Request $request): JsonResponse
+    public function store({entity}Request $request): JsonResponse
     {{
         $entity = $this->service->create($request->validated());
         return response()->json($entity, 201);
     }}
 
-    public function update({self.entity_name}Request $request, string $id): JsonResponse
+    public function update({entity}Request $request, string $id): JsonResponse
     {{
         $entity = $this->service->update($id, $request->validated());
         return response()->json($entity);
@@ -1105,36 +1250,37 @@ class {self.entity_name}Controller
 '''
 
     def _service_template(self) -> str:
+        entity = self.entity_name
         return f'''<?php
 
 namespace App\\Application\\Services;
 
-use App\\Domain\\{self.domain_pascal}\\Entities\\{self.entity_name};
-use App\\Domain\\{self.domain_pascal}\\UseCases\\Create{self.entity_name}UseCase;
-use App\\Domain\\{self.domain_pascal}\\UseCases\\Update{self.entity_name}UseCase;
-use App\\Domain\\{self.domain_pascal}\\UseCases\\Delete{self.entity_name}UseCase;
-use App\\Domain\\{self.domain_pascal}\\Ports\\{self.entity_name}StorePort;
+use App\\Domain\\{self.domain_pascal}\\Entities\\{entity};
+use App\\Domain\\{self.domain_pascal}\\UseCases\\Create{entity}UseCase;
+use App\\Domain\\{self.domain_pascal}\\UseCases\\Update{entity}UseCase;
+use App\\Domain\\{self.domain_pascal}\\UseCases\\Delete{entity}UseCase;
+use App\\Domain\\{self.domain_pascal}\\Ports\\{entity}StorePort;
 
-class {self.entity_name}Service
+class {entity}Service
 {{
     public function __construct(
-        private readonly Create{self.entity_name}UseCase $createUseCase,
-        private readonly Update{self.entity_name}UseCase $updateUseCase,
-        private readonly Delete{self.entity_name}UseCase $deleteUseCase,
-        private readonly {self.entity_name}StorePort $store,
+        private readonly Create{entity}UseCase $createUseCase,
+        private readonly Update{entity}UseCase $updateUseCase,
+        private readonly Delete{entity}UseCase $deleteUseCase,
+        private readonly {entity}StorePort $store,
     ) {{}}
 
-    public function create(array $data): {self.entity_name}
+    public function create(array $data): {entity}
     {{
         return $this->createUseCase->execute($data);
     }}
 
-    public function getById(string $id): ?{self.entity_name}
+    public function getById(string $id): ?{entity}
     {{
         return $this->store->findById($id);
     }}
 
-    public function update(string $id, array $data): {self.entity_name}
+    public function update(string $id, array $data): {entity}
     {{
         return $this->updateUseCase->execute($id, $data);
     }}
@@ -1152,21 +1298,22 @@ class {self.entity_name}Service
 '''
 
     def _provider_template(self) -> str:
+        entity = self.entity_name
         return f'''<?php
 
 namespace App\\Providers;
 
 use Illuminate\\Support\\ServiceProvider;
-use App\\Domain\\{self.domain_pascal}\\Ports\\{self.entity_name}StorePort;
-use App\\Infrastructure\\Repositories\\Eloquent{self.entity_name}Repository;
+use App\\Domain\\{self.domain_pascal}\\Ports\\{entity}StorePort;
+use App\\Infrastructure\\Repositories\\Eloquent{entity}Repository;
 
 class {self.domain_pascal}ServiceProvider extends ServiceProvider
 {{
     public function register(): void
     {{
         $this->app->bind(
-            {self.entity_name}StorePort::class,
-            Eloquent{self.entity_name}Repository::class,
+            {entity}StorePort::class,
+            Eloquent{entity}Repository::class,
         );
     }}
 }}
@@ -1174,8 +1321,8 @@ class {self.domain_pascal}ServiceProvider extends ServiceProvider
 
     def _request_template(self) -> str:
         rules = '\n'.join([
-            f"            '{n}' => ['{('required' if r else 'nullable')}', '{t}'],"
-            for n, t, r in self.fields
+            f"            '{f.name}' => ['{('required' if f.required else 'nullable')}', '{f.type}'],"
+            for f in self.fields
         ])
         return f'''<?php
 
@@ -1207,62 +1354,53 @@ class {self.entity_name}Request extends FormRequest
 class ReactGenerator(BaseGenerator):
     """React + TypeScript + Vite generator"""
 
-    def parse_fields(self, fields_str: str) -> List[Tuple[str, str, bool]]:
-        fields = []
-        for field in fields_str.split(','):
-            field = field.strip()
-            if not field:
-                continue
-            required = not field.endswith('?')
-            field = field.rstrip('?')
-            if ':' in field:
-                name, ts_type = field.split(':', 1)
-            else:
-                name, ts_type = field, 'string'
-            fields.append((name.strip(), ts_type.strip(), required))
-        return fields
+    __slots__ = ()
 
-    def generate(self) -> List[str]:
-        files = []
+    def render_files(self) -> List[Tuple[Path, str]]:
         feature_dir = self.output_dir / 'src' / 'features' / self.module_name
 
-        files.append(self.write_file(feature_dir / 'types.ts', self._types_template()))
-        files.append(self.write_file(feature_dir / 'api.ts', self._api_template()))
-        files.append(self.write_file(feature_dir / 'hooks.ts', self._hooks_template()))
-        files.append(self.write_file(feature_dir / 'components' / f'{self.entity_name}List.tsx', self._list_component_template()))
-        files.append(self.write_file(feature_dir / 'components' / f'{self.entity_name}Form.tsx', self._form_component_template()))
-        files.append(self.write_file(feature_dir / 'index.ts', self._index_template()))
-
-        return files
+        return [
+            (feature_dir / 'types.ts', self._types_template()),
+            (feature_dir / 'api.ts', self._api_template()),
+            (feature_dir / 'hooks.ts', self._hooks_template()),
+            (feature_dir / 'components' / f'{self.entity_name}List.tsx', self._list_component_template()),
+            (feature_dir / 'components' / f'{self.entity_name}Form.tsx', self._form_component_template()),
+            (feature_dir / 'index.ts', self._index_template()),
+        ]
 
     def _types_template(self) -> str:
-        fields = '\n'.join([f"  {n}{'?' if not r else ''}: {t};" for n, t, r in self.fields])
-        create_fields = '\n'.join([f"  {n}{'?' if not r else ''}: {t};" for n, t, r in self.fields])
-        update_fields = '\n'.join([f"  {n}?: {t};" for n, t, _ in self.fields])
-
-        return f'''export interface {self.entity_name} {{
+        entity = self.entity_name
+        fields, update_fields = [], []
+        for f in self.fields:
+            fields.append(f"  {f.name}{'?' if not f.required else ''}: {f.type};")
+            update_fields.append(f"  {f.name}?: {f.type};")
+        # Reused for the create request, which declares the same members
+        fields = '\n'.join(fields)
+        update_fields = '\n'.join(update_fields)
+
+        return f'''export interface {entity} {{
   id: string;
 {fields}
   createdAt: string;
   updatedAt: string;
 }}
 
-export interface Create{self.entity_name}Request {{
-{create_fields}
+export interface Create{entity}Request {{
+{fields}
 }}
 
-export interface Update{self.entity_name}Request {{
+export interface Update{entity}Request {{
 {update_fields}
 }}
 
-export interface {self.entity_name}ListParams {{
+export interface {entity}ListParams {{
   page?: number;
   perPage?: number;
   search?: string;
 }}
 
-export interface {self.entity_name}ListResponse {{
-  items: {self.entity_name}[];
+export interface {entity}ListResponse {{
+  items: {entity}[];
   page: number;
   perPage: number;
   total: number;
@@ -1271,30 +1409,30 @@ export interface {self.entity_name}ListResponse {{
 '''
 
     def _api_template(self) -> str:
-        route = self.to_kebab_case(self.pluralize(self.module_name))
+        entity = self.entity_name
         return f'''import {{ apiClient }} from '@/lib/api';
 import type {{
-  {self.entity_name},
-  Create{self.entity_name}Request,
-  Update{self.entity_name}Request,
-  {self.entity_name}ListParams,
-  {self.entity_name}ListResponse,
+  {entity},
+  Create{entity}Request,
+  Update{entity}Request,
+  {entity}ListParams,
+  {entity}ListResponse,
 }} from './types';
 
-const BASE_URL = '/{route}';
+const BASE_URL = '/{self.route}';
 
-export const {self.to_camel_case(self.module_name)}Api = {{
-  list: (params?: {self.entity_name}ListParams) =>
-    apiClient.get<{self.entity_name}ListResponse>(BASE_URL, {{ params }}),
+export const {self.camel_name}Api = {{
+  list: (params?: {entity}ListParams) =>
+    apiClient.get<{entity}ListResponse>(BASE_URL, {{ params }}),
 
   get: (id: string) =>
-    apiClient.get<{self.entity_name}>(`${{BASE_URL}}/${{id}}`),
+    apiClient.get<{entity}>(`${{BASE_URL}}/${{id}}`),
 
-  create: (data: Create{self.entity_name}Request) =>
-    apiClient.post<{self.entity_name}>(BASE_URL, data),
+  create: (data: Create{entity}Request) =>
+    apiClient.post<{entity}>(BASE_URL, data),
 
-  update: (id: string, data: Update{self.entity_name}Request) =>
-    apiClient.put<{self.entity_name}>(`${{BASE_URL}}/${{id}}`, data),
+  update: (id: string, data: Update{entity}Request) =>
+    apiClient.put<{entity}>(`${{BASE_URL}}/${{id}}`, data),
 
   delete: (id: string) =>
     apiClient.delete(`${{BASE_URL}}/${{id}}`),
@@ -1302,52 +1440,54 @@ export const {self.to_camel_case(self.module_name)}Api = {{
 '''
 
     def _hooks_template(self) -> str:
+        entity = self.entity_name
         return f'''import {{ useQuery, useMutation, useQueryClient }} from '@tanstack/react-query';
-import {{ {self.to_camel_case(self.module_name)}Api }} from './api';
-import type {{ Create{self.entity_name}Request, Update{self.entity_name}Request, {self.entity_name}ListParams }} from './types';
+import {{ {self.camel_name}Api }} from './api';
+import type {{ Create{entity}Request, Update{entity}Request, {entity}ListParams }} from './types';
 
-const QUERY_KEY = '{self.pluralize(self.module_name)}';
+const QUERY_KEY = '{self.plural_name}';
 
-export function use{self.entity_name}List(params?: {self.entity_name}ListParams) {{
-  return useQuery({{ queryKey: [QUERY_KEY, params], queryFn: () => {self.to_camel_case(self.module_name)}Api.list(params) }});
+export function use{entity}List(params?: {entity}ListParams) {{
+  return useQuery({{ queryKey: [QUERY_KEY, params], queryFn: () => {self.camel_name}Api.list(params) }});
 }}
 
-export function use{self.entity_name}(id: string) {{
-  return useQuery({{ queryKey: [QUERY_KEY, id], queryFn: () => {self.to_camel_case(self.module_name)}Api.get(id), enabled: !!id }});
+export function use{entity}(id: string) {{
+  return useQuery({{ queryKey: [QUERY_KEY, id], queryFn: () => {self.camel_name}Api.get(id), enabled: !!id }});
 }}
 
-export function useCreate{self.entity_name}() {{
+export function useCreate{entity}() {{
   const qc = useQueryClient();
-  return useMutation({{ mutationFn: (data: Create{self.entity_name}Request) => {self.to_camel_case(self.module_name)}Api.create(data), onSuccess: () => qc.invalidateQueries({{ queryKey: [QUERY_KEY] }}) }});
+  return useMutation({{ mutationFn: (data: Create{entity}Request) => {self.camel_name}Api.create(data), onSuccess: () => qc.invalidateQueries({{ queryKey: [QUERY_KEY] }}) }});
 }}
 
-export function useUpdate{self.entity_name}() {{
+export function useUpdate{entity}() {{
   const qc = useQueryClient();
-  return useMutation({{ mutationFn: ({{ id, data }}: {{ id: string; data: Update{self.entity_name}Request }}) => {self.to_camel_case(self.module_name)}Api.update(id, data), onSuccess: () => qc.invalidateQueries({{ queryKey: [QUERY_KEY] }}) }});
+  return useMutation({{ mutationFn: ({{ id, data }}: {{ id: string; data: Update{entity}Request }}) => {self.camel_name}Api.update(id, data), onSuccess: () => qc.invalidateQueries({{ queryKey: [QUERY_KEY] }}) }});
 }}
 
-export function useDelete{self.entity_name}() {{
+export function useDelete{entity}() {{
   const qc = useQueryClient();
-  return useMutation({{ mutationFn: (id: string) => {self.to_camel_case(self.module_name)}Api.delete(id), onSuccess: () => qc.invalidateQueries({{ queryKey: [QUERY_KEY] }}) }});
+  return useMutation({{ mutationFn: (id: string) => {self.camel_name}Api.delete(id), onSuccess: () => qc.invalidateQueries({{ queryKey: [QUERY_KEY] }}) }});
 }}
 '''
 
     def _list_component_template(self) -> str:
-        return f'''import {{ use{self.entity_name}List, useDelete{self.entity_name} }} from '../hooks';
-import type {{ {self.entity_name} }} from '../types';
+        entity = self.entity_name
+        return f'''import {{ use{entity}List, useDelete{entity} }} from '../hooks';
+import type {{ {entity} }} from '../types';
 
-export function {self.entity_name}List() {{
-  const {{ data, isLoading, error }} = use{self.entity_name}List();
-  const deleteMutation = useDelete{self.entity_name}();
+export function {entity}List() {{
+  const {{ data, isLoading, error }} = use{entity}List();
+  const deleteMutation = useDelete{entity}();
 
   if (isLoading) return <div>Loading...</div>;
   if (error) return <div>Error: {{error.message}}</div>;
 
   return (
     <div>
-      <h1>{self.entity_name} List</h1>
+      <h1>{entity} List</h1>
       <ul>
-        {{data?.items.map((item: {self.entity_name}) => (
+        {{data?.items.map((item: {entity}) => (
           <li key={{item.id}}>
             {{JSON.stringify(item)}}
             <button onClick={{() => deleteMutation.mutate(item.id)}}>Delete</button>
@@ -1360,20 +1500,21 @@ export function {self.entity_name}List() {{
 '''
 
     def _form_component_template(self) -> str:
+        entity = self.entity_name
         fields = '\n'.join([
-            f'      <input name="{n}" placeholder="{self.to_pascal_case(n)}" {"required" if r else ""} />'
-            for n, t, r in self.fields
+            f'      <input name="{f.name}" placeholder="{f.pascal}" {"required" if f.required else ""} />'
+            for f in self.fields
         ])
-        return f'''import {{ useCreate{self.entity_name} }} from '../hooks';
-import type {{ Create{self.entity_name}Request }} from '../types';
+        return f'''import {{ useCreate{entity} }} from '../hooks';
+import type {{ Create{entity}Request }} from '../types';
 
-export function {self.entity_name}Form() {{
-  const createMutation = useCreate{self.entity_name}();
+export function {entity}Form() {{
+  const createMutation = useCreate{entity}();
 
   const handleSubmit = (e: React.FormEvent<HTMLFormElement>) => {{
     e.preventDefault();
     const formData = new FormData(e.currentTarget);
-    const data = Object.fromEntries(formData) as unknown as Create{self.entity_name}Request;
+    const data = Object.fromEntries(formData) as unknown as Create{entity}Request;
     createMutation.mutate(data);
   }};
 
@@ -1389,11 +1530,12 @@ export function {self.entity_name}Form() {{
 '''
 
     def _index_template(self) -> str:
+        entity = self.entity_name
         return f'''export * from './types';
 export * from './api';
 export * from './hooks';
-export * from './components/{self.entity_name}List';
-export * from './components/{self.entity_name}Form';
+export * from './components/{entity}List';
+export * from './components/{entity}Form';
 '''
 
 
@@ -1404,36 +1546,25 @@ export * from './components/{self.entity_name}Form';
 class FlutterGenerator(BaseGenerator):
     """Flutter + Dart + Riverpod generator"""
 
-    def parse_fields(self, fields_str: str) -> List[Tuple[str, str, bool]]:
-        fields = []
-        for field in fields_str.split(','):
-            field = field.strip()
-            if not field:
-                continue
-            required = not field.endswith('?')
-            field = field.rstrip('?')
-            if ':' in field:
-                name, dart_type = field.split(':', 1)
-            else:
-                name, dart_type = field, 'String'
-            fields.append((name.strip(), dart_type.strip(), required))
-        return fields
+    __slots__ = ()
 
-    def generate(self) -> List[str]:
-        files = []
-        feature_dir = self.output_dir / 'lib' / 'features' / self.module_name
+    DEFAULT_TYPE = 'String'
 
-        files.append(self.write_file(feature_dir / 'data' / 'models' / f'{self.module_name}_model.dart', self._model_template()))
-        files.append(self.write_file(feature_dir / 'data' / 'repositories' / f'{self.module_name}_repository.dart', self._repository_template()))
-        files.append(self.write_file(feature_dir / 'presentation' / 'providers' / f'{self.module_name}_provider.dart', self._provider_template()))
-        files.append(self.write_file(feature_dir / 'presentation' / 'screens' / f'{self.module_name}_list_screen.dart', self._screen_template()))
+    def render_files(self) -> List[Tuple[Path, str]]:
+        feature_dir = self.output_dir / 'lib' / 'features' / self.module_name
 
-        return files
+        return [
+            (feature_dir / 'data' / 'models' / f'{self.module_name}_model.dart', self._model_template()),
+            (feature_dir / 'data' / 'repositories' / f'{self.module_name}_repository.dart', self._repository_template()),
+            (feature_dir / 'presentation' / 'providers' / f'{self.module_name}_provider.dart', self._provider_template()),
+            (feature_dir / 'presentation' / 'screens' / f'{self.module_name}_list_screen.dart', self._screen_template()),
+        ]
 
     def _model_template(self) -> str:
+        entity = self.entity_name
         constructor_params = ', '.join([
-            f"{'required ' if r else ''}this.{self.to_camel_case(n)}"
-            for n, _, r in self.fields
+            f"{'required ' if f.required else ''}this.{f.camel}"
+            for f in self.fields
         ])
         return f'''import 'package:freezed_annotation/freezed_annotation.dart';
 
@@ -1441,42 +1572,43 @@ part '{self.module_name}_model.freezed.dart';
 part '{self.module_name}_model.g.dart';
 
 @freezed
-class {self.entity_name} with _${self.entity_name} {{
-  const factory {self.entity_name}({{
+class {entity} with _${entity} {{
+  const factory {entity}({{
     required String id,
     {constructor_params},
     required DateTime createdAt,
     required DateTime updatedAt,
-  }}) = _{self.entity_name};
+  }}) = _{entity};
 
-  factory {self.entity_name}.fromJson(Map<String, dynamic> json) => _${self.entity_name}FromJson(json);
+  factory {entity}.fromJson(Map<String, dynamic> json) => _${entity}FromJson(json);
 }}
 '''
 
     def _repository_template(self) -> str:
-        route = self.to_kebab_case(self.pluralize(self.module_name))
+        entity = self.entity_name
+        route = self.route
         return f'''import 'package:dio/dio.dart';
 import '../models/{self.module_name}_model.dart';
 
-class {self.entity_name}Repository {{
+class {entity}Repository {{
   final Dio _dio;
 
-  {self.entity_name}Repository(this._dio);
+  {entity}Repository(this._dio);
 
-  Future<List<{self.entity_name}>> getAll() async {{
+  Future<List<{entity}>> getAll() async {{
     final response = await _dio.get('/{route}');
     final items = response.data['items'] as List;
-    return items.map((e) => {self.entity_name}.fromJson(e)).toList();
+    return items.map((e) => {entity}.fromJson(e)).toList();
   }}
 
-  Future<{self.entity_name}> getById(String id) async {{
+  Future<{entity}> getById(String id) async {{
     final response = await _dio.get('/{route}/$id');
-    return {self.entity_name}.fromJson(response.data);
+    return {entity}.fromJson(response.data);
   }}
 
-  Future<{self.entity_name}> create(Map<String, dynamic> data) async {{
+  Future<{entity}> create(Map<String, dynamic> data) async {{
     final response = await _dio.post('/{route}', data: data);
-    return {self.entity_name}.fromJson(response.data);
+    return {entity}.fromJson(response.data);
   }}
 
   Future<void> delete(String id) async {{
@@ -1486,34 +1618,36 @@ class {self.entity_name}Repository {{
 '''
 
     def _provider_template(self) -> str:
+        entity = self.entity_name
         return f'''import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../data/models/{self.module_name}_model.dart';
 import '../data/repositories/{self.module_name}_repository.dart';
 
-final {self.to_camel_case(self.module_name)}RepositoryProvider = Provider<{self.entity_name}Repository>((ref) {{
+final {self.camel_name}RepositoryProvider = Provider<{entity}Repository>((ref) {{
   throw UnimplementedError('Provide Dio instance');
 }});
 
-final {self.to_camel_case(self.module_name)}ListProvider = FutureProvider<List<{self.entity_name}>>((ref) async {{
-  final repository = ref.watch({self.to_camel_case(self.module_name)}RepositoryProvider);
+final {self.camel_name}ListProvider = FutureProvider<List<{entity}>>((ref) async {{
+  final repository = ref.watch({self.camel_name}RepositoryProvider);
   return repository.getAll();
 }});
 '''
 
     def _screen_template(self) -> str:
+        entity = self.entity_name
         return f'''import 'package:flutter/material.dart';
 import 'package:flutter_riverpod/flutter_riverpod.dart';
 import '../providers/{self.module_name}_provider.dart';
 
-class {self.entity_name}ListScreen extends ConsumerWidget {{
-  const {self.entity_name}ListScreen({{super.key}});
+class {entity}ListScreen extends ConsumerWidget {{
+  const {entity}ListScreen({{super.key}});
 
   @override
   Widget build(BuildContext context, WidgetRef ref) {{
-    final itemsAsync = ref.watch({self.to_camel_case(self.module_name)}ListProvider);
+    final itemsAsync = ref.watch({self.camel_name}ListProvider);
 
     return Scaffold(
-      appBar: AppBar(title: const Text('{self.entity_name} List')),
+      appBar: AppBar(title: const Text('{entity} List')),
       body: itemsAsync.when(
         data: (items) => ListView.builder(
           itemCount: items.length,
@@ -1551,7 +1685,14 @@ GENERATORS = {
 
 BACKEND_STACKS = {'go', 'laravel'}
 
+# Stacks whose generator honors --ops
+OPS_STACKS = {'go'}
+
 def main():
+    # Imported here so that importing the generators as a library stays cheap
+    import argparse
+    import sys
+
     parser = argparse.ArgumentParser(
         description='Universal Module Generator (DDD for backend, feature-based for frontend)',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1571,9 +1712,25 @@ Frontend examples:
     parser.add_argument('--domain', '-d', default='', help='Domain name (required for backend DDD stacks)')
     parser.add_argument('--project', '-p', default='', help='Project path (Go module path, etc.)')
     parser.add_argument('--output', '-o', default='.', help='Output directory')
+    sink = parser.add_mutually_exclusive_group()
+    sink.add_argument('--artifact', '-a', default='', help='Write all files into this tar archive (paths relative to --output) instead of the filesystem')
+    sink.add_argument('--stdout', action='store_true', help='Print all files to stdout, each after a "--- FILE: path ---" line, instead of writing them')
+    parser.add_argument('--ops', default='', help=f"CRUD operations to generate, comma separated (default: all of {','.join(CRUD_OPS)}; go only)")
 
     args = parser.parse_args()
 
+    ops = [op.strip() for op in args.ops.split(',') if op.strip()]
+    unknown = [op for op in ops if op not in CRUD_OPS]
+    if unknown:
+        print(f"Error: unknown --ops value(s): {', '.join(unknown)}")
+        print(f"Valid operations: {', '.join(CRUD_OPS)}")
+        sys.exit(1)
+
+    if ops and args.stack not in OPS_STACKS:
+        print(f"Error: --ops is not supported for stack '{args.stack}'")
+        print(f"Supported stacks: {', '.join(sorted(OPS_STACKS))}")
+        sys.exit(1)
+
     if args.stack in BACKEND_STACKS and not args.domain:
         print(f"Error: --domain is required for backend stack '{args.stack}'")
         print(f"Example: --domain wallet")
@@ -1586,16 +1743,22 @@ Frontend examples:
         project=args.project,
         output_dir=args.output,
         domain=args.domain,
+        ops=ops,
+        artifact=args.artifact,
+        stdout=args.stdout,
     )
 
     files = generator.generate()
 
     stack_type = "DDD" if args.stack in BACKEND_STACKS else "feature-based"
     domain_info = f" (domain: {args.domain})" if args.domain else ""
-    print(f"\n  Generated {len(files)} files for {args.stack}/{args.name} [{stack_type}]{domain_info}:\n")
+    artifact_info = f" into {args.artifact}" if args.artifact else ""
+    # With --stdout the files are the output, so the summary goes to stderr
+    summary = sys.stderr if args.stdout else sys.stdout
+    print(f"\n  Generated {len(files)} files{artifact_info} for {args.stack}/{args.name} [{stack_type}]{domain_info}:\n", file=summary)
     for f in files:
-        print(f"   {f}")
-    print()
+        print(f"   {f}", file=summary)
+    print(file=summary)
 
 if __name__ == '__main__':
     main()